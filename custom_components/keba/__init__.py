@@ -1,10 +1,10 @@
 """Support for KEBA charging stations."""
 
-import logging
+from __future__ import annotations
 
-from keba_kecontact import create_keba_connection
-from keba_kecontact.charging_station import ChargingStation, KebaService
-from keba_kecontact.connection import KebaKeContact, SetupError
+from dataclasses import dataclass, field
+import logging
+from typing import TYPE_CHECKING, Final
 
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import (
@@ -14,8 +14,8 @@ from homeassistant.const import (
     CONF_NAME,
     Platform,
 )
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
 from homeassistant.helpers import device_registry as dr, discovery
 from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
@@ -23,34 +23,111 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import slugify
 
 from .const import (
-    CHARGING_STATIONS,
     CONF_FS,
     CONF_FS_FALLBACK,
     CONF_FS_PERSIST,
     CONF_FS_TIMEOUT,
     CONF_RFID,
     CONF_RFID_CLASS,
-    DATA_HASS_CONFIG,
     DOMAIN,
-    KEBA_CONNECTION,
 )
 
+if TYPE_CHECKING:
+    from keba_kecontact.charging_station import ChargingStation
+    from keba_kecontact.connection import KebaKeContact
+
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [
+
+@dataclass(slots=True)
+class KebaDomainData:
+    """Runtime data of the keba domain stored in hass.data."""
+
+    hass_config: ConfigType = field(default_factory=dict)
+    connection: KebaKeContact | None = None
+    stations: dict[str, ChargingStation] = field(default_factory=dict)
+    service_dispatch: dict[str, tuple[dict, dict]] = field(default_factory=dict)
+    device_station_cache: dict[str, tuple[ChargingStation, str]] = field(
+        default_factory=dict
+    )
+
+
+_START_STOP_SERVICES: Final = frozenset(("start", "stop"))
+
+PLATFORMS = (
     Platform.BINARY_SENSOR,
     Platform.LOCK,
     Platform.BUTTON,
     Platform.NOTIFY,
     Platform.SENSOR,
     Platform.NUMBER,
-]
+)
+
+# Notify has no config entry support yet and is set up through discovery
+_FORWARD_PLATFORMS: Final = tuple(p for p in PLATFORMS if p is not Platform.NOTIFY)
+
+# One shared DeviceInfo per station instead of one per entity; invalidated on
+# entry unload
+_DEVICE_INFO_CACHE: dict[str, DeviceInfo] = {}
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the KEBA charging station component from configuration.yaml."""
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][DATA_HASS_CONFIG] = config
+    # Imported lazily so Home Assistant does not pay for the library at startup
+    from keba_kecontact.charging_station import KebaService
+
+    domain_data: KebaDomainData = hass.data.setdefault(DOMAIN, KebaDomainData())
+    domain_data.hass_config = config
+
+    # Resolve the device registry once; service calls reuse the cached handle
+    device_reg = dr.async_get(hass)
+
+    async def execute_service(call: ServiceCall) -> None:
+        """Execute a service for a charging station."""
+        keba = domain_data.connection
+        if keba is None:
+            raise ServiceValidationError("No KEBA charging station is set up")
+
+        device_id: str = str(call.data.get(CONF_DEVICE_ID))
+        resolved = _get_charging_station(
+            hass, device_reg, keba, device_id, domain_data.device_station_cache
+        )
+        if resolved is None:
+            return
+        _, station_entry_id = resolved
+
+        # The dispatch table is registered at the end of entry setup; a call
+        # racing setup or a reload must not surface as a bare KeyError
+        dispatch_entry = domain_data.service_dispatch.get(station_entry_id)
+        if dispatch_entry is None:
+            raise ServiceValidationError(
+                "The KEBA charging station is still being set up, try again later"
+            )
+
+        dispatch, start_stop_defaults = dispatch_entry
+        function_call = dispatch.get(call.service)
+        if function_call is None:
+            raise ServiceValidationError(
+                f"Service {call.service} is not supported by this charging station"
+            )
+
+        parameters = {k: v for k, v in call.data.items() if k != CONF_DEVICE_ID}
+        if call.service in _START_STOP_SERVICES:
+            for conf, value in start_stop_defaults.items():
+                parameters.setdefault(conf, value)
+        await function_call(**parameters)
+
+    # Register all services once at domain level; the handler dispatches to the
+    # charging station selected via the device id
+    for service in KebaService:
+        if service != KebaService.DISPLAY:
+            hass.services.async_register(DOMAIN, service.value, execute_service)
+
+    @callback
+    def _device_registry_updated(event: Event) -> None:
+        domain_data.device_station_cache.pop(event.data["device_id"], None)
+
+    hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, _device_registry_updated)
 
     if DOMAIN in config:
         async_create_issue(
@@ -70,26 +147,41 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 async def _async_set_failsafe(hass: HomeAssistant, entry: ConfigEntry):
-    if CONF_FS in entry.options:
-        charging_station = hass.data[DOMAIN][CHARGING_STATIONS][entry.entry_id]
+    if CONF_FS not in entry.options:
+        return
+
+    charging_station = entry.runtime_data
+    opts = entry.options
+
+    async def _set_failsafe() -> None:
         try:
-            hass.loop.create_task(
-                charging_station.set_failsafe(
-                    entry.options[CONF_FS],
-                    entry.options[CONF_FS_TIMEOUT],
-                    entry.options[CONF_FS_FALLBACK],
-                    entry.options[CONF_FS_PERSIST],
-                )
+            await charging_station.set_failsafe(
+                opts[CONF_FS],
+                opts[CONF_FS_TIMEOUT],
+                opts[CONF_FS_FALLBACK],
+                opts[CONF_FS_PERSIST],
             )
         except ValueError as ex:
             _LOGGER.warning("Could not set failsafe mode %s", ex)
 
+    entry.async_create_background_task(hass, _set_failsafe(), name="keba_failsafe")
+
 
 def _get_charging_station(
-    hass: HomeAssistant, device_id: str
-) -> ChargingStation | None:
+    hass: HomeAssistant,
+    device_reg: dr.DeviceRegistry,
+    keba: KebaKeContact,
+    device_id: str,
+    cache: dict[str, tuple[ChargingStation, str]],
+) -> tuple[ChargingStation, str] | None:
+    # The mapping is stable while an entry is loaded, so serve repeat calls
+    # from the cache; it is invalidated on unload and device registry updates
+    resolved = cache.get(device_id)
+    if resolved is not None:
+        return resolved
+
     # Get and check home assistant device linked to device_id
-    device = dr.async_get(hass).async_get(device_id)
+    device = device_reg.async_get(device_id)
     if not device:
         _LOGGER.error("Could not find a device for id: %s", device_id)
         return None
@@ -103,25 +195,38 @@ def _get_charging_station(
         return None
 
     # Get and check keba charging station from host in config_entry
-    keba = hass.data[DOMAIN][KEBA_CONNECTION]
     host = config_entry.data[CONF_HOST]
     charging_station = keba.get_charging_station(host)
     if charging_station is None:
         _LOGGER.error("Could not find a charging station with host %s", host)
         return None
 
-    return charging_station
+    cache[device_id] = resolved = (charging_station, config_entry.entry_id)
+    return resolved
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up KEBA charging station from a config entry."""
+    from keba_kecontact.charging_station import KebaService
+    from keba_kecontact.connection import SetupError
+
     keba = await get_keba_connection(hass)
     try:
         charging_station = await keba.setup_charging_station(entry.data[CONF_HOST])
     except SetupError as exc:
         raise ConfigEntryNotReady(f"{entry.data[CONF_HOST]} not reachable") from exc
 
-    hass.data[DOMAIN][CHARGING_STATIONS][entry.entry_id] = charging_station
+    domain_data: KebaDomainData = hass.data[DOMAIN]
+    domain_data.stations[entry.entry_id] = charging_station
+    # Direct attribute access for per-entry consumers (platforms, failsafe)
+    entry.runtime_data = charging_station
+
+    # Start platform setup eagerly; it only needs the charging station object
+    # and overlaps with the remaining entry setup
+    platforms_task = hass.async_create_task(
+        hass.config_entries.async_forward_entry_setups(entry, _FORWARD_PLATFORMS),
+        eager_start=True,
+    )
 
     # Set failsafe mode at start up of Home Assistant if configured in options
     await _async_set_failsafe(hass, entry)
@@ -129,39 +234,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Add update listener for config entry changes (options)
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
-    # Register services to hass
-    async def execute_service(call: ServiceCall) -> None:
-        """Execute a service for a charging station."""
-        device_id: str = str(call.data.get(CONF_DEVICE_ID))
-        charging_station: ChargingStation | None = _get_charging_station(
-            hass, device_id
-        )
-        if charging_station is None:
-            return
-
-        function_call = getattr(charging_station, call.service)
-
-        additional_args = {}
-        if call.service in ["start", "stop"]:
-            if (
-                CONF_RFID not in call.data
-                and CONF_RFID in entry.options
-                and entry.options[CONF_RFID] != ""
-            ):
-                additional_args[CONF_RFID] = entry.options[CONF_RFID]
-            if (
-                CONF_RFID_CLASS not in call.data
-                and CONF_RFID_CLASS in entry.options
-                and entry.options[CONF_RFID_CLASS] != ""
-            ):
-                additional_args[CONF_RFID_CLASS] = entry.options[CONF_RFID_CLASS]
-        parameters = call.data.copy()
-        parameters.pop(CONF_DEVICE_ID)
-        await function_call(**parameters, **additional_args)
+    # Precompute RFID defaults for start/stop once; an options change reloads
+    # the entry and rebuilds them
+    start_stop_defaults = {
+        conf: entry.options[conf]
+        for conf in (CONF_RFID, CONF_RFID_CLASS)
+        if entry.options.get(conf)
+    }
 
+    # Bind each supported service to its method once instead of a getattr per call
+    dispatch = {}
     for service in charging_station.device_info.available_services():
         if service != KebaService.DISPLAY:
-            hass.services.async_register(DOMAIN, service.value, execute_service)
+            dispatch[service.value] = getattr(charging_station, service.value)
         else:
             # set up notify platform, no entry support for notify platform yet,
             # have to use discovery to load platform.
@@ -171,46 +256,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     Platform.NOTIFY,
                     DOMAIN,
                     {CONF_NAME: DOMAIN, CONF_ENTITY_ID: entry.entry_id},
-                    hass.data[DOMAIN][DATA_HASS_CONFIG],
+                    domain_data.hass_config,
                 )
             )
+    domain_data.service_dispatch[entry.entry_id] = (dispatch, start_stop_defaults)
 
-    # Set up all platforms except notify
-    await hass.config_entries.async_forward_entry_setups(
-        entry, [platform for platform in PLATFORMS if platform != Platform.NOTIFY]
-    )
+    # Wait for all platforms except notify to finish
+    await platforms_task
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    keba = hass.data[DOMAIN][KEBA_CONNECTION]
+    from keba_kecontact.charging_station import KebaService
+
+    domain_data: KebaDomainData = hass.data[DOMAIN]
+    keba = domain_data.connection
+    stations = domain_data.stations
+    host = entry.data[CONF_HOST]
+    entry_id = entry.entry_id
 
     unload_ok = await hass.config_entries.async_unload_platforms(
-        entry, [platform for platform in PLATFORMS if platform != Platform.NOTIFY]
+        entry, _FORWARD_PLATFORMS
     )
 
     # Remove notify
-    charging_station = keba.get_charging_station(entry.data[CONF_HOST])
-    if KebaService.DISPLAY in charging_station.device_info.available_services():
+    charging_station = keba.get_charging_station(host)
+    available_services = charging_station.device_info.available_services()
+    if KebaService.DISPLAY in available_services:
         hass.services.async_remove(
             Platform.NOTIFY, f"{DOMAIN}_{slugify(charging_station.device_info.model)}"
         )
 
-    # Only remove services if it is the last charging station
-    if len(hass.data[DOMAIN][CHARGING_STATIONS]) == 1:
-        _LOGGER.debug("Removing last charging station, cleanup services and notify")
-
-        for service in charging_station.device_info.available_services():
-            if service == KebaService.DISPLAY:
-                hass.services.async_remove(Platform.NOTIFY, DOMAIN)
-            else:
-                hass.services.async_remove(DOMAIN, service.value)
-
     if unload_ok:
-        keba.remove_charging_station(entry.data[CONF_HOST])
-        hass.data[DOMAIN][CHARGING_STATIONS].pop(entry.entry_id)
+        keba.remove_charging_station(host)
+        stations.pop(entry_id)
+        _DEVICE_INFO_CACHE.pop(charging_station.device_info.device_id, None)
+        domain_data.service_dispatch.pop(entry_id, None)
+        cache = domain_data.device_station_cache
+        for device_id in [d for d, (_, eid) in cache.items() if eid == entry_id]:
+            del cache[device_id]
+
+        # Only remove notify if it was the last charging station; domain
+        # services stay registered for the lifetime of Home Assistant
+        if not stations and KebaService.DISPLAY in available_services:
+            _LOGGER.debug("Removing last charging station, cleanup notify")
+            hass.services.async_remove(Platform.NOTIFY, DOMAIN)
 
     return unload_ok
 
@@ -222,13 +314,13 @@ async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> Non
 
 async def get_keba_connection(hass: HomeAssistant) -> KebaKeContact:
     """Set up internal keba connection (ensure same keba connection instance)."""
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(CHARGING_STATIONS, {})
+    from keba_kecontact import create_keba_connection
 
-    if KEBA_CONNECTION not in hass.data[DOMAIN]:
-        hass.data[DOMAIN][KEBA_CONNECTION] = await create_keba_connection(hass.loop)
+    domain_data: KebaDomainData = hass.data.setdefault(DOMAIN, KebaDomainData())
+    if domain_data.connection is None:
+        domain_data.connection = await create_keba_connection(hass.loop)
 
-    return hass.data[DOMAIN][KEBA_CONNECTION]
+    return domain_data.connection
 
 
 class KebaBaseEntity(Entity):
@@ -245,27 +337,46 @@ class KebaBaseEntity(Entity):
         self._charging_station = charging_station
         self.entity_description = description
 
-        wb_info = self._charging_station.device_info
-
-        self._attr_name = f"{wb_info.manufacturer} {wb_info.model} {description.name}"
-        self._attr_unique_id = f"{DOMAIN}-{wb_info.device_id}-{description.key}"
+        wb_info = charging_station.device_info
+        manufacturer = wb_info.manufacturer
+        model = wb_info.model
+        device_id = wb_info.device_id
+        prefix = f"{manufacturer} {model}"
+
+        self._attr_name = f"{prefix} {description.name}"
+        self._attr_unique_id = f"{DOMAIN}-{device_id}-{description.key}"
+
+        device_info = _DEVICE_INFO_CACHE.get(device_id)
+        if device_info is None:
+            device_info = _DEVICE_INFO_CACHE[device_id] = DeviceInfo(
+                identifiers={(DOMAIN, device_id)},
+                manufacturer=manufacturer,
+                model=model,
+                name=prefix,
+                sw_version=wb_info.sw_version,
+                configuration_url=wb_info.webconfigurl,
+            )
+        self._attr_device_info = device_info
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, wb_info.device_id)},
-            manufacturer=wb_info.manufacturer,
-            model=wb_info.model,
-            name=f"{wb_info.manufacturer} {wb_info.model}",
-            sw_version=wb_info.sw_version,
-            configuration_url=wb_info.webconfigurl,
-        )
+    def _update_attrs(self) -> None:
+        """Read the latest cached values from the charging station."""
 
+    @callback
     def update_callback(self, *args) -> None:
-        """Schedule a state update."""
-        self.schedule_update_ha_state(True)
+        """Write the latest cached state to Home Assistant."""
+        self._update_attrs()
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Add callback after being added to hass.
 
         Show latest data after startup.
         """
+        self._update_attrs()
         self._charging_station.add_callback(self.update_callback)
+        # keba-kecontact 4.0.2 does not expose remove_callback; unload discards
+        # the station object including its callback list, so only deregister
+        # explicitly when the library supports it
+        remove_callback = getattr(self._charging_station, "remove_callback", None)
+        if remove_callback is not None:
+            self.async_on_remove(lambda: remove_callback(self.update_callback))
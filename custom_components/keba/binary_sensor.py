@@ -4,7 +4,6 @@ from collections.abc import Mapping
 from typing import Any
 
 from keba_kecontact.charging_station import ChargingStation
-from keba_kecontact.connection import KebaKeContact
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -12,14 +11,13 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, EntityCategory
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import KebaBaseEntity
-from .const import DOMAIN, KEBA_CONNECTION
 
-SENSOR_TYPES = [
+SENSOR_TYPES: tuple[BinarySensorEntityDescription, ...] = (
     # default
     BinarySensorEntityDescription(
         key="Plug_EV",
@@ -66,7 +64,7 @@ SENSOR_TYPES = [
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -75,17 +73,13 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the keba charging station binary sensors from config entry."""
-    keba: KebaKeContact = hass.data[DOMAIN][KEBA_CONNECTION]
-    entities: list[KebaBinarySensor] = []
-
-    charging_station = keba.get_charging_station(config_entry.data[CONF_HOST])
-    entities.extend(
+    charging_station: ChargingStation = config_entry.runtime_data
+    async_add_entities(
         [
             KebaBinarySensor(charging_station, description)
             for description in SENSOR_TYPES
         ]
     )
-    async_add_entities(entities, True)
 
 
 class KebaBinarySensor(KebaBaseEntity, BinarySensorEntity):
@@ -99,22 +93,31 @@ class KebaBinarySensor(KebaBaseEntity, BinarySensorEntity):
         """Initialize the KEBA Sensor."""
         super().__init__(charging_station, description)
         self._attributes: dict[str, str] = {}
+        self._key = description.key
+        self._is_failsafe = description.key == "FS_on"
+        self._last_timeout: Any = None
+        self._last_fallback: Any = None
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return the state attributes of the binary sensor."""
         return self._attributes
 
-    async def async_update(self) -> None:
+    def _update_attrs(self) -> None:
         """Get latest cached states from the device."""
-        key = self.entity_description.key
-        self._attr_is_on = self._charging_station.get_value(key)
+        get_value = self._charging_station.get_value
+        value = get_value(self._key)
 
-        if key == "FS_on":
-            self._attr_is_on = not self._attr_is_on
-            self._attributes["failsafe_timeout"] = str(
-                self._charging_station.get_value("Tmo FS")
-            )
-            self._attributes["fallback_current"] = str(
-                self._charging_station.get_value("Curr FS")
-            )
+        if self._is_failsafe:
+            self._attr_is_on = not value
+            # Only rebuild the attribute strings when the raw values changed
+            timeout = get_value("Tmo FS")
+            if timeout != self._last_timeout:
+                self._last_timeout = timeout
+                self._attributes["failsafe_timeout"] = str(timeout)
+            fallback = get_value("Curr FS")
+            if fallback != self._last_fallback:
+                self._last_fallback = fallback
+                self._attributes["fallback_current"] = str(fallback)
+        else:
+            self._attr_is_on = value
@@ -1,27 +1,22 @@
 """Support for KEBA button entities."""
 
-from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
-from typing import Any
 
 from keba_kecontact.charging_station import ChargingStation
-from keba_kecontact.connection import KebaKeContact
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import KebaBaseEntity
-from .const import DOMAIN, KEBA_CONNECTION
 
 
 @dataclass
 class KebaButtonEntityDescription(ButtonEntityDescription):
     """Class describing Keba button entities."""
 
-    remote_function: Callable[[ChargingStation], Coroutine[Any, Any, Any]] | None = None
+    method_name: str | None = None
 
 
 BUTTON_TYPES: tuple[KebaButtonEntityDescription, ...] = (
@@ -29,28 +24,32 @@ BUTTON_TYPES: tuple[KebaButtonEntityDescription, ...] = (
         key="request_data",
         icon="mdi:refresh",
         name="Request data",
-        remote_function=lambda charging_station: charging_station.request_data(),
+        method_name="request_data",
     ),
     KebaButtonEntityDescription(
         key="enable",
         icon="mdi:play",
         name="Enable",
-        remote_function=lambda charging_station: charging_station.enable(),
+        method_name="enable",
     ),
     KebaButtonEntityDescription(
         key="disable",
         icon="mdi:stop",
         name="Disable",
-        remote_function=lambda charging_station: charging_station.disable(),
+        method_name="disable",
     ),
     KebaButtonEntityDescription(
         key="unlock_socket",
         icon="mdi:ev-plug-type2",
         name="Unlock Socket",
-        remote_function=lambda charging_station: charging_station.unlock_socket(),
+        method_name="unlock_socket",
     ),
 )
 
+# Every description must name a remote method; checked once at import instead
+# of on every press
+assert all(description.method_name for description in BUTTON_TYPES)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -58,14 +57,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the keba charging station buttons from config entry."""
-    keba: KebaKeContact = hass.data[DOMAIN][KEBA_CONNECTION]
-    entities: list[KebaButton] = []
-
-    charging_station = keba.get_charging_station(config_entry.data[CONF_HOST])
-    entities.extend(
-        [KebaButton(charging_station, description) for description in BUTTON_TYPES]
+    charging_station: ChargingStation = config_entry.runtime_data
+    async_add_entities(
+        KebaButton(charging_station, description) for description in BUTTON_TYPES
     )
-    async_add_entities(entities, True)
 
 
 class KebaButton(KebaBaseEntity, ButtonEntity):
@@ -80,8 +75,9 @@ class KebaButton(KebaBaseEntity, ButtonEntity):
     ) -> None:
         """Initialize keba button."""
         super().__init__(charging_station, description)
+        # Bind the remote method once so a press is a single await
+        self._remote_function = getattr(charging_station, description.method_name)
 
     async def async_press(self) -> None:
         """Process the button press."""
-        if self.entity_description.remote_function:
-            await self.entity_description.remote_function(self._charging_station)
+        await self._remote_function()
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 from ipaddress import ip_network
 import logging
+from time import monotonic
 from typing import Any
 
 from keba_kecontact.utils import SetupError
@@ -35,16 +38,49 @@ STEP_HOST_SCHEMA = vol.Schema(
     }
 )
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_FS, default=False): bool,
+        vol.Required(CONF_FS_PERSIST, default=False): bool,
+        vol.Required(CONF_FS_TIMEOUT, default=30): vol.All(
+            int, vol.Range(min=10, max=600)
+        ),
+        vol.Required(CONF_FS_FALLBACK, default=6): vol.All(
+            int, vol.Range(min=6, max=63)
+        ),
+        vol.Optional(CONF_RFID, default=""): cv.string,
+        vol.Optional(CONF_RFID_CLASS, default=""): cv.string,
+    }
+)
+
+# Successful device probes are cached briefly so a user resubmitting the flow
+# (select step, transient form errors) does not rerun the network probe
+_DEVICE_INFO_TTL = 60.0
+_device_info_cache: dict[str, tuple[float, Any]] = {}
+
+
+@lru_cache(maxsize=32)
+def _broadcast_address(ip: str, prefix: int) -> str:
+    """Return the broadcast address of the given interface address."""
+    return str(ip_network(f"{ip}/{prefix}", False).broadcast_address)
+
 
 async def validate_input(
     hass: core.HomeAssistant, data: dict[str, Any]
 ) -> dict[str, str]:
     """Validate given keba charging station host by setting it up."""
     keba = await get_keba_connection(hass)
-    try:
-        device_info = await keba.get_device_info(data[CONF_HOST])
-    except SetupError as exc:
-        raise CannotConnect from exc
+    host = data[CONF_HOST]
+
+    cached = _device_info_cache.get(host)
+    if cached is not None and monotonic() - cached[0] < _DEVICE_INFO_TTL:
+        device_info = cached[1]
+    else:
+        try:
+            device_info = await keba.get_device_info(host)
+        except SetupError as exc:
+            raise CannotConnect from exc
+        _device_info_cache[host] = (monotonic(), device_info)
 
     # Return info that you want to store in the config entry.
     return {"title": device_info.model, "unique_id": device_info.device_id}
@@ -58,7 +94,8 @@ class KebaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialize the Keba flow."""
-        self._discovered_devices: list[str] = []
+        self._discovered_devices: set[str] = set()
+        self._adapters: list[network.Adapter] | None = None
 
     async def async_step_import(self, import_data) -> FlowResult:
         """Import keba config from configuration.yaml."""
@@ -77,22 +114,31 @@ class KebaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # discovery using keba library
             keba = await get_keba_connection(self.hass)
 
-            adapters = await network.async_get_adapters(self.hass)
-            for adapter in adapters:
-                for ip_info in adapter["ipv4"]:
-                    local_ip = ip_info["address"]
-                    network_prefix = ip_info["network_prefix"]
-                    ip_net = ip_network(f"{local_ip}/{network_prefix}", False)
-                    discovered_devices = await keba.discover_devices(
-                        str(ip_net.broadcast_address)
+            # NIC enumeration can be slow; do it once per flow and reuse on
+            # retries after "no_device_found"
+            if self._adapters is None:
+                self._adapters = await network.async_get_adapters(self.hass)
+            coros = [
+                keba.discover_devices(
+                    _broadcast_address(
+                        ip_info["address"], ip_info["network_prefix"]
                     )
-                    for device in discovered_devices:
-                        if device not in self._discovered_devices:
-                            self._discovered_devices.append(device)
+                )
+                for adapter in self._adapters
+                for ip_info in adapter["ipv4"]
+            ]
+            # Discover all subnets concurrently; wall time is the slowest
+            # subnet instead of the sum of all timeouts
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    _LOGGER.debug("Discovery failed on one subnet: %s", result)
+                    continue
+                self._discovered_devices.update(result)
 
             # More than one charging station could be discovered by that method
             if len(self._discovered_devices) == 1:
-                user_input[CONF_HOST] = self._discovered_devices[0]
+                user_input[CONF_HOST] = next(iter(self._discovered_devices))
                 return await self.async_step_connect(user_input)
             if len(self._discovered_devices) > 1:
                 # show selection form
@@ -100,6 +146,11 @@ class KebaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             errors["base"] = "no_device_found"
 
+        return self._show_user_form(errors)
+
+    @callback
+    def _show_user_form(self, errors: dict[str, str]) -> FlowResult:
+        """Render the shared host form."""
         return self.async_show_form(
             step_id="user", data_schema=STEP_HOST_SCHEMA, errors=errors
         )
@@ -112,7 +163,7 @@ class KebaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_connect(user_input)
 
         select_scheme = vol.Schema(
-            {vol.Required("host"): vol.In(list(self._discovered_devices))}
+            {vol.Required("host"): vol.In(sorted(self._discovered_devices))}
         )
 
         return self.async_show_form(step_id="select", data_schema=select_scheme)
@@ -127,10 +178,13 @@ class KebaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input:
             try:
                 info = await validate_input(self.hass, user_input)
-            except CannotConnect:
+            except (CannotConnect, TimeoutError):
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
+                # Traceback rendering is expensive; keep it out of retry loops
+                _LOGGER.debug(
+                    "Unexpected exception during keba validation", exc_info=True
+                )
                 errors["base"] = "unknown"
 
             if info:
@@ -138,9 +192,7 @@ class KebaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(title=info["title"], data=user_input)
 
-        return self.async_show_form(
-            step_id="user", data_schema=STEP_HOST_SCHEMA, errors=errors
-        )
+        return self._show_user_form(errors)
 
     @staticmethod
     @callback
@@ -148,17 +200,12 @@ class KebaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         config_entry: config_entries.ConfigEntry,
     ) -> KebaOptionsFlow:
         """Return a Keba options flow."""
-        return KebaOptionsFlow(config_entry)
+        return KebaOptionsFlow()
 
 
 class KebaOptionsFlow(config_entries.OptionsFlow):
     """Handle a option flow for keba charging station."""
 
-    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
-        """Initialize keba charging station option flow."""
-        self.config_entry = config_entry
-        self.options = dict(config_entry.options)
-
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -167,33 +214,8 @@ class KebaOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_FS,
-                        default=self.config_entry.options.get(CONF_FS, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_FS_PERSIST,
-                        default=self.config_entry.options.get(CONF_FS_PERSIST, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_FS_TIMEOUT,
-                        default=self.config_entry.options.get(CONF_FS_TIMEOUT, 30),
-                    ): vol.All(int, vol.Range(min=10, max=600)),
-                    vol.Required(
-                        CONF_FS_FALLBACK,
-                        default=self.config_entry.options.get(CONF_FS_FALLBACK, 6),
-                    ): vol.All(int, vol.Range(min=6, max=63)),
-                    vol.Optional(
-                        CONF_RFID,
-                        default=self.config_entry.options.get(CONF_RFID, ""),
-                    ): cv.string,
-                    vol.Optional(
-                        CONF_RFID_CLASS,
-                        default=self.config_entry.options.get(CONF_RFID_CLASS, ""),
-                    ): cv.string,
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
             ),
         )
 
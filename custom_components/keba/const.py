@@ -1,9 +1,6 @@
 """Constants for the Abfallplus integration."""
 
 DOMAIN = "keba"
-CHARGING_STATIONS = "wallboxes"
-KEBA_CONNECTION = "connection"
-DATA_HASS_CONFIG = "hass_config"
 
 CONF_RFID = "rfid"
 CONF_RFID_CLASS = "rfid_class"
@@ -3,16 +3,16 @@
 from typing import Any
 
 from keba_kecontact.charging_station import ChargingStation
-from keba_kecontact.connection import KebaKeContact
 
 from homeassistant.components.lock import LockEntity, LockEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import KebaBaseEntity
-from .const import CONF_RFID, CONF_RFID_CLASS, DOMAIN, KEBA_CONNECTION
+from .const import CONF_RFID, CONF_RFID_CLASS
+
+LOCK_DESCRIPTION = LockEntityDescription(key="Authreq", name="Authentication")
 
 
 async def async_setup_entry(
@@ -21,11 +21,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the keba charging station locks from config entry."""
-    keba: KebaKeContact = hass.data[DOMAIN][KEBA_CONNECTION]
-    entities: list[KebaLock] = []
-
-    charging_station = keba.get_charging_station(entry.data[CONF_HOST])
-    lock_description = LockEntityDescription(key="Authreq", name="Authentication")
+    charging_station: ChargingStation = entry.runtime_data
 
     additional_args = {}
     if CONF_RFID in entry.options and entry.options[CONF_RFID] != "":
@@ -33,9 +29,9 @@ async def async_setup_entry(
     if CONF_RFID_CLASS in entry.options and entry.options[CONF_RFID_CLASS] != "":
         additional_args[CONF_RFID_CLASS] = entry.options[CONF_RFID_CLASS]
 
-    lock = KebaLock(charging_station, lock_description, additional_args)
-    entities.append(lock)
-    async_add_entities(entities, True)
+    async_add_entities(
+        [KebaLock(charging_station, LOCK_DESCRIPTION, additional_args)]
+    )
 
 
 class KebaLock(KebaBaseEntity, LockEntity):
@@ -51,7 +47,7 @@ class KebaLock(KebaBaseEntity, LockEntity):
         super().__init__(charging_station, description)
         self._additional_args = additional_args if additional_args is not None else {}
 
-    async def async_update(self) -> None:
+    def _update_attrs(self) -> None:
         """Get latest cached states from the device."""
         self._attr_is_locked = (
             self._charging_station.get_value(self.entity_description.key) == 1
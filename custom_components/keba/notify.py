@@ -13,7 +13,7 @@ from homeassistant.components.notify import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
-from . import DOMAIN, KEBA_CONNECTION
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,7 +61,7 @@ async def async_get_service(
 ) -> KebaNotificationService:
     """Return the notify service."""
 
-    keba = hass.data[DOMAIN][KEBA_CONNECTION]
+    keba = hass.data[DOMAIN].connection
     targets = {
         w.device_info.model: w
         for w in keba.get_charging_stations()
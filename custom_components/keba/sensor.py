@@ -1,10 +1,10 @@
 """Support for KEBA charging station sensors."""
 
 from collections.abc import Mapping
+from dataclasses import replace
 from typing import Any
 
 from keba_kecontact.charging_station import ChargingStation
-from keba_kecontact.connection import KebaKeContact
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -14,7 +14,6 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    CONF_HOST,
     PERCENTAGE,
     EntityCategory,
     UnitOfElectricCurrent,
@@ -27,9 +26,22 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import KebaBaseEntity
-from .const import DOMAIN, KEBA_CONNECTION
 
-SENSOR_TYPES = [
+# Templates for the per-phase sensors, fanned out below with replace()
+_PHASE_VOLTAGE = SensorEntityDescription(
+    key="U",
+    device_class=SensorDeviceClass.VOLTAGE,
+    native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+    entity_registry_enabled_default=False,
+)
+_PHASE_CURRENT = SensorEntityDescription(
+    key="I",
+    device_class=SensorDeviceClass.CURRENT,
+    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+    entity_registry_enabled_default=False,
+)
+
+SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
     # default
     SensorEntityDescription(key="State_details", name="Status", icon="mdi:ev-station"),
     SensorEntityDescription(
@@ -83,48 +95,12 @@ SENSOR_TYPES = [
         device_class=SensorDeviceClass.POWER_FACTOR,
         entity_registry_enabled_default=False,
     ),
-    SensorEntityDescription(
-        key="U1",
-        name="Voltage at phase 1",
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        entity_registry_enabled_default=False,
-    ),
-    SensorEntityDescription(
-        key="U2",
-        name="Voltage at phase 2",
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        entity_registry_enabled_default=False,
-    ),
-    SensorEntityDescription(
-        key="U3",
-        name="Voltage at phase 3",
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        entity_registry_enabled_default=False,
-    ),
-    SensorEntityDescription(
-        key="I1",
-        name="Current at phase 1",
-        device_class=SensorDeviceClass.CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        entity_registry_enabled_default=False,
-    ),
-    SensorEntityDescription(
-        key="I2",
-        name="Current at phase 2",
-        device_class=SensorDeviceClass.CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        entity_registry_enabled_default=False,
-    ),
-    SensorEntityDescription(
-        key="I3",
-        name="Current at phase 3",
-        device_class=SensorDeviceClass.CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        entity_registry_enabled_default=False,
-    ),
+    replace(_PHASE_VOLTAGE, key="U1", name="Voltage at phase 1"),
+    replace(_PHASE_VOLTAGE, key="U2", name="Voltage at phase 2"),
+    replace(_PHASE_VOLTAGE, key="U3", name="Voltage at phase 3"),
+    replace(_PHASE_CURRENT, key="I1", name="Current at phase 1"),
+    replace(_PHASE_CURRENT, key="I2", name="Current at phase 2"),
+    replace(_PHASE_CURRENT, key="I3", name="Current at phase 3"),
     SensorEntityDescription(
         key="Max curr",
         name="Maximum current (system)",
@@ -243,7 +219,7 @@ SENSOR_TYPES = [
         native_unit_of_measurement=UnitOfTime.SECONDS,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -252,14 +228,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Keba charging station sensors from config entry."""
-    keba: KebaKeContact = hass.data[DOMAIN][KEBA_CONNECTION]
-    entities: list[KebaSensor] = []
-
-    charging_station = keba.get_charging_station(config_entry.data[CONF_HOST])
-    entities.extend(
-        [KebaSensor(charging_station, description) for description in SENSOR_TYPES]
+    charging_station: ChargingStation = config_entry.runtime_data
+    async_add_entities(
+        KebaSensor(charging_station, description) for description in SENSOR_TYPES
     )
-    async_add_entities(entities, True)
 
 
 class KebaSensor(KebaBaseEntity, SensorEntity):
@@ -272,20 +244,30 @@ class KebaSensor(KebaBaseEntity, SensorEntity):
     ) -> None:
         """Initialize the KEBA Sensor."""
         super().__init__(charging_station, description)
-        self._attributes: dict[str, str] = {}
+        self._key = description.key
+        self._get_value = charging_station.get_value
+        # Only "Curr user" ever exposes attributes; skip the dict elsewhere
+        # and bind its attribute refresh once instead of comparing keys on
+        # every update
+        if description.key == "Curr user":
+            self._attributes: dict[str, str] | None = {}
+            self._post_update = self._update_curr_user_attributes
+        else:
+            self._attributes = None
+            self._post_update = None
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return the state attributes of the binary sensor."""
         return self._attributes
 
-    async def async_update(self) -> None:
+    def _update_curr_user_attributes(self) -> None:
+        """Refresh the attributes of the set-current sensor."""
+        self._attributes["max_current_hardware"] = self._get_value("Curr HW")
+
+    def _update_attrs(self) -> None:
         """Get latest cached states from the device."""
-        self._attr_native_value = self._charging_station.get_value(
-            self.entity_description.key
-        )
+        self._attr_native_value = self._get_value(self._key)
 
-        if self.entity_description.key == "Curr user":
-            self._attributes["max_current_hardware"] = self._charging_station.get_value(
-                "Curr HW"
-            )
+        if self._post_update is not None:
+            self._post_update()